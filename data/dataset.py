@@ -1,7 +1,55 @@
+import os
 from pathlib import Path
+from multiprocessing import Pool
 from tqdm import tqdm
 
-from .fom import solvensave
+from .fom import solvensave, _compile_forms, _silence_stdout
+
+
+# Data folder shared by all the tasks of a worker process (set by the pool initializer)
+_DATA_FOLDER = None
+
+
+def _init_worker(data_folder: str) -> None:
+    """
+    .. admonition:: Description
+
+        Initialize a worker process of the pool by storing the data folder once,
+        so that it does not need to be pickled along with every task, and silencing
+        the Gmsh output once for all the meshes the worker will read.
+
+    :param data_folder: Path to the data folder.
+    """
+    global _DATA_FOLDER
+    _DATA_FOLDER = data_folder
+    _silence_stdout()
+
+
+def _solvensave_worker(mesh: str) -> None:
+    """
+    .. admonition:: Description
+
+        Solve and save the results for a single mesh inside a worker process.
+
+    :param mesh: Path to the mesh file.
+    """
+    solvensave(mesh, data_folder=_DATA_FOLDER)
+
+def _pending_meshes(mesh_folder: str, done: set):
+    """
+    .. admonition:: Description
+
+        Lazily yield the mesh files that don't have a corresponding results file yet.
+
+    :param mesh_folder: Path to the mesh folder.
+    :param done: Set of the names (without extension) of the already computed results.
+    :return: Generator of mesh file paths.
+    """
+    with os.scandir(mesh_folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(".msh") and entry.name[:-4] not in done and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
 
 def _reset_results(data_folder: str = "test") -> None:
     """
@@ -12,16 +60,17 @@ def _reset_results(data_folder: str = "test") -> None:
     :param data_folder: Path to the data folder.
     """
     # Ensure the results folder is empty before running the script
-    results_folder = Path(data_folder) / "results"
-    if results_folder.exists():
-        for file in results_folder.iterdir():
-            if file.is_file():
-                file.unlink()
+    results_folder = os.path.join(data_folder, "results")
+    if os.path.isdir(results_folder):
+        with os.scandir(results_folder) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.path)
     else:
-        results_folder.mkdir(parents=True)
+        os.makedirs(results_folder)
 
 
-def generate_datasets(data_folder: str = "test", empty_results_folder: bool = True) -> None:
+def generate_datasets(data_folder: str = "test", empty_results_folder: bool = True, max_workers: int = 1) -> None:
     """
     .. admonition:: Description
         
@@ -29,6 +78,7 @@ def generate_datasets(data_folder: str = "test", empty_results_folder: bool = Tr
 
     :param data_folder: path to the data folder.
     :param empty_results_folder: Whether to empty the results folder before generating new datasets.
+    :param max_workers: Maximum number of worker processes to use for parallel dataset generation.
 
     :raises FileNotFoundError: If the mesh folder does not exist.
     """
@@ -36,22 +86,34 @@ def generate_datasets(data_folder: str = "test", empty_results_folder: bool = Tr
     if empty_results_folder:
         _reset_results(data_folder)
 
-    # Get the list of mesh files
+    # Check the mesh folder
     mesh_folder_path = Path(f"{data_folder}/msh")
     if not mesh_folder_path.exists():
         raise FileNotFoundError(f"The specified mesh folder '{mesh_folder_path}' does not exist.")
-    meshes = list(mesh_folder_path.iterdir())
 
     # Process only the meshes that don't have a corresponding results file yet
     results_folder_path = Path(f"{data_folder}/results")
-    meshes = [mesh for mesh in meshes if not (results_folder_path / f"{mesh.stem}.h5").exists()]
-
-    for mesh in tqdm(
-        meshes,
-        total=len(meshes),
-        desc="🚀 Generating solution datasets",
-        ncols=100,
-        bar_format="{desc} |{bar}| {percentage:3.0f}% [{n}/{total}] ⏱️ {elapsed} ETA {remaining}",
-        colour='blue'
-    ):
-        solvensave(mesh, data_folder=data_folder)
\ No newline at end of file
+    results_folder_path.mkdir(parents=True, exist_ok=True)
+    with os.scandir(results_folder_path) as entries:
+        done = {entry.name[:-3] for entry in entries if entry.name.endswith(".h5")}
+
+    # Count the pending meshes without materializing them, they are streamed to the pool below
+    total = sum(1 for _ in _pending_meshes(mesh_folder_path, done))
+
+    # Send the meshes in chunks to amortize the inter-process communication
+    chunksize = max(1, total // (max_workers * 4))
+
+    # Compile the forms once here, so that the workers find them in the JIT cache
+    if total > 0:
+        _compile_forms()
+
+    with Pool(max_workers, initializer=_init_worker, initargs=(data_folder,)) as pool:
+        for _ in tqdm(
+            pool.imap_unordered(_solvensave_worker, _pending_meshes(mesh_folder_path, done), chunksize=chunksize),
+            total=total,
+            desc="🚀 Generating solution datasets",
+            ncols=100,
+            bar_format="{desc} |{bar}| {percentage:3.0f}% [{n}/{total}] ⏱️ {elapsed} ETA {remaining}",
+            colour='blue'
+        ):
+            pass
@@ -1,6 +1,3 @@
-from pathlib import Path
-import alphashape
-from shapely import Point
 import numpy as np
 
 from mpi4py import MPI
@@ -17,6 +14,39 @@ import os, sys
 import h5py
 
 
+# PETSc options for the potential solve (SPD Laplacian: conjugate gradient with algebraic multigrid)
+_POTENTIAL_SOLVER_OPTIONS = {
+    "ksp_type": "cg",
+    "pc_type": "hypre",
+    "pc_hypre_type": "boomeramg",
+    "ksp_rtol": 1e-10,
+    "ksp_atol": 1e-14,
+}
+
+# Source term of the Laplace problem (mesh independent)
+_SOURCE_TERM = default_scalar_type(0.0)
+
+# Whether the process stdout has already been redirected to /dev/null
+_STDOUT_SILENCED = False
+
+
+def _silence_stdout() -> None:
+    """
+    .. admonition:: Description
+
+        Redirect the stdout file descriptor of the current process to ``/dev/null`` for its whole lifetime.
+        It is meant to be called once at the startup of the worker processes, to silence Gmsh chatter
+        without redirecting and restoring the stdout around every mesh read.
+    """
+    global _STDOUT_SILENCED
+    if _STDOUT_SILENCED:
+        return
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+    _STDOUT_SILENCED = True
+
+
 def _get_domain_from_mesh(mesh_path: str):
     """
     .. admonition:: Description
@@ -48,44 +78,84 @@ def _compute_boundary_normals_and_midpoints(domain, boundary_facets: np.ndarray)
     :returns:
         - **normals** (``np.ndarray``) -- Normal vectors at the boundary facets.
         - **midpoints** (``np.ndarray``) -- Midpoints of the boundary facets.
+
+    .. note::
+
+        The facet to cell connectivity of the domain must already be created.
     """
     # 2D: facet dimension
     fdim = domain.topology.dim - 1
 
-    # Connectivity: facets -> vertices
+    # Connectivity: facets -> vertices (each facet of a 2D mesh has exactly two vertices)
     facet_vertices = domain.topology.connectivity(fdim, 0)
-
-    midpoints = []
-    normals = []
-
-    for f in boundary_facets:
-        vertices = facet_vertices.links(f)  # get vertex indices for this facet
-        p0 = domain.geometry.x[vertices[0]]
-        p1 = domain.geometry.x[vertices[1]]
-        # Compute 2D edge vector
-        edge = p1 - p0
-        # Compute normal vector (perpendicular to edge)
-        n_vec = np.array([-edge[1], edge[0]])
-        n_vec /= np.linalg.norm(n_vec)
-        normals.append(n_vec)
-        midpoints.append((p0 + p1)/2)
-
-    normals = np.array(normals)
-    midpoints = np.array(midpoints)[:, :2]  # only x and y coordinates
+    vertices = facet_vertices.array.reshape(-1, 2)[boundary_facets]
+    p0 = domain.geometry.x[vertices[:, 0], :2]
+    p1 = domain.geometry.x[vertices[:, 1], :2]
+
+    # Compute 2D edge vectors and the normal vectors (perpendicular to the edges)
+    edges = p1 - p0
+    normals = np.stack([-edges[:, 1], edges[:, 0]], axis=1)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    midpoints = 0.5 * (p0 + p1)
     
-    # Create polygon and point objects
-    polygon = alphashape.alphashape(midpoints, alpha=0.1)  # tune alpha
-    eps = 1e-6
-    p = np.zeros_like(midpoints)
-    for n, mp in zip(normals, midpoints):
-        p = mp + eps * n  
-        point = Point(p) 
-        if polygon.contains(point):
-            n *= -1
+    # The plate is not meshed, so each of its facets has a single neighbouring cell:
+    # flip the normals that don't point towards it (i.e. that point inside the plate)
+    tdim = domain.topology.dim
+    facet_cells = domain.topology.connectivity(fdim, tdim)
+    cells = facet_cells.array[facet_cells.offsets[boundary_facets]]
+    cell_vertices = domain.topology.connectivity(tdim, 0).array.reshape(-1, tdim + 1)[cells]
+    centroids = domain.geometry.x[cell_vertices, :2].mean(axis=1)
+    inside = np.einsum("ij,ij->i", centroids - midpoints, normals) < 0
+    normals[inside] *= -1
 
     return normals, midpoints
 
 
+def _potential_forms(V) -> tuple:
+    """
+    .. admonition:: Description
+
+        Build the bilinear and linear forms of the Laplace problem for the potential.
+
+    :param V: The (Lagrange P1) function space of the potential.
+
+    :returns:
+        - **a** (``ufl.Form``) -- Bilinear form.
+        - **L** (``ufl.Form``) -- Linear form.
+    """
+    # Trial and test functions
+    u = ufl.TrialFunction(V)
+    v = ufl.TestFunction(V)
+
+    # Source term
+    f = fem.Constant(V.mesh, _SOURCE_TERM)
+
+    return ufl.dot(ufl.grad(u), ufl.grad(v)) * ufl.dx, f * v * ufl.dx
+
+
+def _compile_forms() -> None:
+    """
+    .. admonition:: Description
+
+        Compile the forms and expressions used by :func:`fom` on a tiny mesh, to fill the DOLFINx JIT cache.
+
+    .. note::
+
+        The compiled code depends only on the finite elements and on the cell type (not on the mesh itself),
+        so calling this once before spawning the workers lets each of them load the cached libraries
+        instead of running FFCx (possibly all at the same time) on the first mesh.
+    """
+    from dolfinx.mesh import create_unit_square
+
+    domain = create_unit_square(MPI.COMM_SELF, 1, 1)
+    V = functionspace(domain, ("Lagrange", 1))
+    a, L = _potential_forms(V)
+    fem.form(a)
+    fem.form(L)
+    V_grad = functionspace(domain, ("DG", 0, (domain.geometry.dim, )))
+    fem.Expression(ufl.grad(fem.Function(V)), V_grad.element.interpolation_points)
+
+
 def fom(mesh: str, bc_lower_plate: float = 1.0, bc_upper_plate: float = 0.0) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     .. admonition:: Description
@@ -112,20 +182,10 @@ def fom(mesh: str, bc_lower_plate: float = 1.0, bc_upper_plate: float = 0.0) ->
         We return the midpoints of the facets of the upper plate boundary since the gradient is constant on each cell (we chose DG0).
     """
 
-    if mesh.is_file() and mesh.suffix == ".msh":
-        # Silence Gmsh chatter
-        stdout_fd = sys.stdout.fileno()
-        saved_stdout = os.dup(stdout_fd)
-        devnull = os.open(os.devnull, os.O_WRONLY)
-        os.dup2(devnull, stdout_fd)
-        os.close(devnull)
-        
+    mesh = os.fspath(mesh)
+    if mesh.endswith(".msh") and os.path.isfile(mesh):
         domain, cell_tags, facet_tags = gmshio.read_from_msh(mesh, MPI.COMM_WORLD, 0, gdim=2)
         
-        # Restore stdout
-        os.dup2(saved_stdout, stdout_fd)
-        os.close(saved_stdout)
-        
         ## SOLVE FOR THE POTENTIAL DISTRIBUTION ##
 
         # Define finite element function space
@@ -134,7 +194,10 @@ def fom(mesh: str, bc_lower_plate: float = 1.0, bc_upper_plate: float = 0.0) ->
         # Identify the boundary (create facet to cell connectivity required to determine boundary facets)
         tdim = domain.topology.dim
         fdim = tdim - 1
-        domain.topology.create_connectivity(fdim, tdim)
+        facet_cells = domain.topology.connectivity(fdim, tdim)
+        if facet_cells is None:
+            domain.topology.create_connectivity(fdim, tdim)
+            facet_cells = domain.topology.connectivity(fdim, tdim)
 
         # Find facets marked with 10, 11, 12 (the two plates)
         facets_rect1 = np.concatenate([facet_tags.find(10), facet_tags.find(11)])
@@ -154,20 +217,11 @@ def fom(mesh: str, bc_lower_plate: float = 1.0, bc_upper_plate: float = 0.0) ->
 
         bcs = [bc1, bc2]
 
-        # Trial and test functions
-        u = ufl.TrialFunction(V)
-        v = ufl.TestFunction(V)
-
-        # Source term
-        f = fem.Constant(domain, default_scalar_type(0.0))
-
         # Variational problem
-        a = ufl.dot(ufl.grad(u), ufl.grad(v)) * ufl.dx
-        L = f * v * ufl.dx
+        a, L = _potential_forms(V)
 
         # Assemble the system
-         
-        problem = LinearProblem(a, L, bcs=bcs, petsc_options={"ksp_type": "preonly", "pc_type": "lu"})
+        problem = LinearProblem(a, L, bcs=bcs, petsc_options=_POTENTIAL_SOLVER_OPTIONS)
         uh = problem.solve()
 
 
@@ -176,20 +230,14 @@ def fom(mesh: str, bc_lower_plate: float = 1.0, bc_upper_plate: float = 0.0) ->
         # Define the vector function space for the gradient
         V_grad = fem.functionspace(domain, ("DG", 0, (domain.geometry.dim, )))
 
-        # Define the trial and test functions for the vector space
-        u_vec = ufl.TrialFunction(V_grad)
-        v_vec = ufl.TestFunction(V_grad)
-
         # Define the gradient of the solution
         grad_u = ufl.grad(uh)
 
-        # Define the bilinear and linear forms
-        a_grad = ufl.inner(u_vec, v_vec) * ufl.dx
-        L_grad = ufl.inner(grad_u, v_vec) * ufl.dx
-
-        # Assemble the system
-        problem_grad = LinearProblem(a_grad, L_grad, petsc_options={"ksp_type": "preonly", "pc_type": "lu"})
-        grad_uh = problem_grad.solve()
+        # The gradient of a P1 function is constant on each cell, so interpolating it
+        # into DG0 gives the same values as the L2 projection without any linear solve
+        grad_expr = fem.Expression(grad_u, V_grad.element.interpolation_points)
+        grad_uh = fem.Function(V_grad)
+        grad_uh.interpolate(grad_expr)
 
 
         ## EXTRACT AND RETURN RELEVANT DATA ##
@@ -211,20 +259,17 @@ def fom(mesh: str, bc_lower_plate: float = 1.0, bc_upper_plate: float = 0.0) ->
 
         # Extract gradient components
         dim = domain.geometry.dim
-        grad_x = grad_uh.x.array[0::dim]
-        grad_y = grad_uh.x.array[1::dim]
-
-        # Extract gradient components on the upper plate
-        boundary_cells = []
-        for f in boundary_facets:
-            # get the cell connected to this facet
-            connected_cell = domain.topology.connectivity(fdim, tdim).links(f)[0]
-            boundary_cells.append(connected_cell)
-        grad_x_plate = grad_x[boundary_cells]
-        grad_y_plate = grad_y[boundary_cells]
+        grad = grad_uh.x.array.reshape(-1, dim)
+        grad_x = grad[:, 0]
+        grad_y = grad[:, 1]
+
+        # Extract the gradient on the upper plate with a single gather of whole rows
+        # (take the first cell connected to each facet straight from the connectivity arrays)
+        boundary_cells = facet_cells.array[facet_cells.offsets[boundary_facets]]
+        grad_plate = grad[boundary_cells, :2]
         
         # Extract cell connectivity
-        cells = domain.topology.connectivity(domain.topology.dim, 0).array.reshape(-1, domain.geometry.dim + 1)
+        cells = domain.topology.connectivity(tdim, 0).array.reshape(-1, tdim + 1)
 
         # Plot potential distribution and gradient components
         # from plot_solutions import plot
@@ -235,12 +280,30 @@ def fom(mesh: str, bc_lower_plate: float = 1.0, bc_upper_plate: float = 0.0) ->
         # Extract the normal vectors the upper plate boundary with corresponding midpoints
         normal_vectors_plate, midpoints_plate = _compute_boundary_normals_and_midpoints(domain, boundary_facets)
 
-        # Compute the normal derivative on the plate
-        normal_derivatives_plate = grad_x_plate * normal_vectors_plate[:,0] + grad_y_plate * normal_vectors_plate[:,1]
+        # Compute the normal derivative on the plate (row-wise dot product in a single pass)
+        normal_derivatives_plate = np.einsum("ij,ij->i", grad_plate, normal_vectors_plate)
         
         return x, y, cells, potential, grad_x, grad_y, midpoints_plate, normal_derivatives_plate, normal_vectors_plate
 
 
+def _boundary_edges(cells: np.ndarray) -> np.ndarray:
+    """
+    .. admonition:: Description
+
+        Find the edges on the boundary of a triangular mesh, i.e. the ones belonging to a single cell.
+
+    :param cells: Connectivity of the mesh cells.
+    :return: Boundary edges as pairs of vertex indices (the smaller first), with shape (number of edges, 2).
+    """
+    # Pack each (sorted) edge of each cell into a single 64 bit key
+    i = cells.astype(np.uint64)
+    j = np.roll(i, -1, axis=1)
+    keys = ((np.minimum(i, j) << np.uint64(32)) | np.maximum(i, j)).ravel()
+    keys, counts = np.unique(keys, return_counts=True)
+    keys = keys[counts == 1]
+    return np.stack([keys >> np.uint64(32), keys & np.uint64(0xFFFFFFFF)], axis=1).astype(cells.dtype)
+
+
 def solvensave(mesh: str, data_folder: str = "test") -> None:
     """
     .. admonition:: Description
@@ -250,19 +313,21 @@ def solvensave(mesh: str, data_folder: str = "test") -> None:
     :param mesh: path to the mesh file.
     :param data_folder: path to the data folder.
     """
-    if mesh.is_file() and mesh.suffix == ".msh":
+    mesh = os.fspath(mesh)
+    if mesh.endswith(".msh") and os.path.isfile(mesh):
         x, y, cells, potential, grad_x, grad_y, midpoints_plate, normal_derivatives_plate, normal_vectors_plate = fom(mesh) 
         # Save the results in a .h5 file
-        results_folder = Path(data_folder) / "results"
-        base_name = os.path.splitext(os.path.basename(mesh))[0]
-        filename = results_folder / f"{base_name}.h5"
-        with h5py.File(filename, "w") as file:
-            file.create_dataset("x", data=x)
-            file.create_dataset("y", data=y)
-            file.create_dataset("cells", data=cells)
-            file.create_dataset("potential", data=potential)
-            file.create_dataset("grad_x", data=grad_x)
-            file.create_dataset("grad_y", data=grad_y)
+        base_name = os.path.basename(mesh)[:-4]
+        filename = os.path.join(data_folder, "results", base_name + ".h5")
+        # Store the cells with the narrowest unsigned integer type that fits the vertex indices
+        cells = cells.astype(np.min_scalar_type(cells.max()), copy=False)
+        # Store also the boundary edges, so that the plots don't have to recompute the mesh adjacency
+        boundary_edges = _boundary_edges(cells)
+        with h5py.File(filename, "w", libver="latest") as file:
+            # Large per-node/per-cell arrays are chunked and compressed
+            for key, data in (("x", x), ("y", y), ("cells", cells), ("potential", potential), ("grad_x", grad_x), ("grad_y", grad_y), ("boundary_edges", boundary_edges)):
+                file.create_dataset(key, data=data, chunks=True, compression="lzf", shuffle=True)
+            # Small upper plate arrays are stored contiguously
             file.create_dataset("normal_derivatives_plate", data=normal_derivatives_plate)
             file.create_dataset("midpoints_plate", data=midpoints_plate)
-            file.create_dataset("normal_vectors_plate", data=normal_vectors_plate)
\ No newline at end of file
+            file.create_dataset("normal_vectors_plate", data=normal_vectors_plate)
@@ -14,7 +14,7 @@ There are several optional arguments to customize the behavior:
 - ``--parameters_file_name``: Name of the parameters file to save the generated parameters (default: "parameters.csv").
 - ``--geometry_input``: Path to the input geometry file (default: "geometry.geo").
 - ``--plot_number``: Number of the solution to plot (default: 1).
-- ``--workers``: Number of worker processes to use for parallel mesh generation (default: 1).
+- ``--workers``: Number of worker processes to use for parallel mesh and dataset generation (default: 1).
 """
 
 import argparse
@@ -30,16 +30,17 @@ def main():
     parser.add_argument("--parameters_file_name", type=str, default="parameters.csv", help="Name of the parameters file to save the generated parameters.")
     parser.add_argument("--geometry_input", type=str, default="geometry.geo", help="Path to the input geometry file.")
     parser.add_argument("--plot_number", type=int, default=1, help="Number of the solution to plot.")
-    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes to use for parallel mesh generation.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes to use for parallel mesh and dataset generation.")
 
-    data_folder = parser.parse_args().folder
-    empty_old_mesh = not parser.parse_args().keep_old_mesh
-    empty_old_results = not parser.parse_args().keep_old_results
-    data_file = parser.parse_args().data_file
-    parameters_file_name = parser.parse_args().parameters_file_name
-    geometry_input = parser.parse_args().geometry_input
-    plot_number = parser.parse_args().plot_number
-    workers = parser.parse_args().workers
+    args = parser.parse_args()
+    data_folder = args.folder
+    empty_old_mesh = not args.keep_old_mesh
+    empty_old_results = not args.keep_old_results
+    data_file = args.data_file
+    parameters_file_name = args.parameters_file_name
+    geometry_input = args.geometry_input
+    plot_number = args.plot_number
+    workers = args.workers
 
     from .geometry import read_data_file
     names, ranges, num_points = read_data_file(data_file)
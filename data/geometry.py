@@ -1,16 +1,17 @@
 import os
+import re
+import shutil
 import numpy as np
-from itertools import product
+from functools import lru_cache, partial
 from tqdm import tqdm
 import csv
-import contextlib
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 
 def _setup_data(parameters_head : str, 
                parameters_file_name: str, 
                ignore_data: bool = False,
-               data_folder: str = "test") -> None:
+               data_folder: str = "test") -> str:
     """
     .. admonition:: Description
 
@@ -24,60 +25,35 @@ def _setup_data(parameters_head : str,
     :param parameters_file_name: Name of the parameters CSV file.
     :param ignore_data: Whether to ignore existing other data present in data_folder.
     :param data_folder: Path to the data folder to reset.
-    :return: None
+    :return: Path to the parameters CSV file.
         
     .. note::
 
         In any case, this function ensures the necessary subfolders
         and parameters file are set up.
     """
-    # Suppress print statements from reset_environment
-    with open(os.devnull, 'w') as fnull:
-        with contextlib.redirect_stdout(fnull):
-
-            # If the folder is not present create it
-            if not os.path.exists(data_folder):
-                os.makedirs(data_folder)
-
-            if not ignore_data:
-                # remove all the files inside it
-                for root, dirs, files in os.walk(data_folder, topdown=False):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        try:
-                            os.remove(file_path)
-                        except Exception as e:
-                            print(f"Error removing {file_path}: {e}")
-            else:
-                # Clean only geo subfolder
-                geo_folder = os.path.join(data_folder, "geo")
-                for root, dirs, files in os.walk(geo_folder, topdown=False):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        try:
-                            os.remove(file_path)
-                        except Exception as e:
-                            print(f"Error removing {file_path}: {e}")
+    if not ignore_data:
+        # Remove the whole folder in one go
+        shutil.rmtree(data_folder, ignore_errors=True)
+    else:
+        # Clean only geo subfolder
+        shutil.rmtree(os.path.join(data_folder, "geo"), ignore_errors=True)
+
+    # If the folder is not present create it
+    os.makedirs(data_folder, exist_ok=True)
     
     # Parameters file path
     parameters_file = os.path.join(data_folder, parameters_file_name)
     
     # Setup parameters file
-    with open(parameters_file, "w") as csv_file:
-        csv_file.write(parameters_head)
-        csv_file.truncate()
-
-    # Create geo subfolder
-    geo_folder = os.path.join(data_folder, "geo")
-    os.makedirs(geo_folder, exist_ok=True)
+    with open(parameters_file, "wb") as csv_file:
+        csv_file.write(parameters_head.encode("utf-8"))
 
-    # Create mshfiles subfolder
-    mshfiles_folder = os.path.join(data_folder, "msh")
-    os.makedirs(mshfiles_folder, exist_ok=True)
+    # Create geo, msh and results subfolders
+    for subfolder in ("geo", "msh", "results"):
+        os.makedirs(os.path.join(data_folder, subfolder), exist_ok=True)
 
-    # Create results subfolder
-    results_folder = os.path.join(data_folder, "results")
-    os.makedirs(results_folder, exist_ok=True)
+    return parameters_file
 
 
 ## 
@@ -114,85 +90,98 @@ def read_data_file(file_path: str = "test.csv") -> tuple:
     return names, ranges, num_points
 
 
+@lru_cache(maxsize=None)
+def _quantities_pattern(quantities: tuple[str, ...]) -> re.Pattern:
+    """
+    .. admonition:: Description
+
+        Compile (once per set of quantities) the regular expression matching the lines of a geometry file
+        that assign any of the given quantities, capturing the text before the ``=`` sign.
+
+    :param quantities: Quantities to match (e.g., 'distance', 'overetch', 'coeff(1)', etc.).
+    :return: Compiled regular expression.
+    """
+    alternatives = "|".join(re.escape(quantity + " =") for quantity in quantities)
+    return re.compile(r"^(?=.*(?:" + alternatives + r"))([^=\n]*)=.*$", re.MULTILINE)
+
+
+##
+# @param input_text (str): Content of the geometry file (e.g., geometry.geo).
+# @param quantities (list): Quantities to turn into placeholders (e.g., ['distance', 'overetch', 'coeff(1)']).
+def _build_template(input_text: str, quantities: list[str]) -> str:
+    """
+    .. admonition:: Description
+
+        Turn the content of a geometry file into a ``str.format`` template, where the value of the
+        i-th quantity is replaced by the positional placeholder ``{i}``, so that every geometry
+        can be produced by string interpolation only.
+
+    :param input_text: Content of the geometry file (e.g., geometry.geo).
+    :param quantities: Quantities to turn into placeholders (e.g., ['distance', 'overetch', 'coeff(1)']).
+    :return: Template of the geometry file.
+    """
+    needles = [quantity + " =" for quantity in quantities]
+    pieces = []
+    last = 0
+    for match in _quantities_pattern(tuple(quantities)).finditer(input_text):
+        # If a line assigns more than one quantity, the last one wins
+        line = match.group(0)
+        index = [i for i, needle in enumerate(needles) if needle in line][-1]
+        # Braces of the geometry file must be escaped, since they are format fields
+        pieces.append(input_text[last:match.start()].replace("{", "{{").replace("}", "}}"))
+        pieces.append(match.group(1).replace("{", "{{").replace("}", "}}") + "= {" + str(index) + "};")
+        last = match.end()
+    pieces.append(input_text[last:].replace("{", "{{").replace("}", "}}"))
+    return "".join(pieces)
+
+
 ##
-# @param input_path (str): Path to the geometry file (e.g., geometry.geo).
-# @param output_path (str): Path to save the modified geometry file (e.g., ./).
+# @param text (str): Content of the new geometry file.
+# @param output_path (str): Path to save the new geometry file (e.g., ./).
 # @param name (str): Name for the new geometry file (e.g., test).
-# @param quantity(str): Quantity to modify (e.g., 'distance', 'overetch', 'coeff(1)', etc.).
-# @param value (float): New quantity value to set (e.g., 2.0).
-def _modify_quantity(input_path: str, output_path: str, name: str, quantity: str, value: float):
+def _write_geometry(text: str, output_path: str, name: str):
     """
     .. admonition:: Description
         
-        Modify the geometry file to change the distance between the plates.
+        Save the given content as a new geometry file.
     
-    :param input_path: Path to the geometry file (e.g., geometry.geo).
-    :param output_path: Path to save the modified geometry file (e.g., ./).
+    :param text: Content of the new geometry file.
+    :param output_path: Path to the existing folder where to save the new geometry file (e.g., ./).
     :param name: Name for the new geometry file (e.g., test).
-    :param quantity: Quantity to modify (e.g., 'distance', 'overetch', 'coeff(1)', etc.).
-    :param value: New quantity value to set (e.g., 2.0).
     :return: None
     """
-    # Open the geometry.geo file to read the lines
-    with open(str(input_path), "r") as f:
-        lines = f.readlines()
-        
-    new_lines = []
-    for line in lines:
-
-        if str(quantity) + ' =' in line:
-            # Split the line by '='
-            parts = line.split('=')
-            # Update the distance value
-            new_line = f"{parts[0]}= {value};\n"
-            new_lines.append(new_line)
-
-        else:
-            # If the line doesn't match any of the points, keep it unchanged
-            new_lines.append(line)
-    
     # Define the directory and file name for saving the new geometry
     directory = str(output_path)
     file_name = str(name) + ".geo"
     
-    # Create the directory if it doesn't exist
-    os.makedirs(directory, exist_ok=True)
-    
     # Define the full file path
     file_path = os.path.join(directory, file_name)
     
-    # Write the modified lines to the new geometry file
-    with open(file_path, "w") as f:
-        f.writelines(new_lines)
+    # Write the text to the new geometry file with raw writes, skipping the text layer
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
-    #print(f"Geometry updated setting {quantity} to {value}. Saved to {file_path}")
 
-
-def _generate_single_geometry(j: int, param: tuple, geometry_input: str, names: list, data_folder: str) -> str:
+def _generate_single_geometry(j: int, param: np.ndarray, template: str, geo_folder: str) -> None:
     """
     .. admonition:: Description
         
-        Generate a single geometry and return the CSV row string.
+        Generate a single geometry.
 
     :param j: Geometry index.
-    :param param: Tuple of parameter values for the geometry.
-    :param geometry_input: Path to the input geometry file.
-    :param names: List of quantity names.
-    :param data_folder: Path to the data folder.
-    :return: CSV row string representing the geometry parameters.
+    :param param: Parameter values for the geometry.
+    :param template: Template of the input geometry file (see :func:`_build_template`).
+    :param geo_folder: Path to the geo subfolder of the data folder.
+    :return: None
     """
-    geo_folder = os.path.join(data_folder, "geo")
-    geo_path = os.path.join(geo_folder, f"{j}.geo")
-    
-    # Modify the first quantity using geometry_input
-    _modify_quantity(geometry_input, geo_folder, str(j), names[0], param[0])
-    
-    # Modify the rest
-    for i in range(1, len(names)):
-        _modify_quantity(geo_path, geo_folder, str(j), names[i], param[i])
-    
-    # Return CSV row as string
-    return f"{j}," + ",".join([str(p) for p in param]) + "\n"
+    # Fill in all the quantities of the input geometry at once
+    _write_geometry(template.format(*param), geo_folder, str(j))
+
 
 def generate_geometries(names: list[str],
                         ranges: list[tuple],
@@ -215,7 +204,7 @@ def generate_geometries(names: list[str],
     :param data_folder: Path to the data folder.
     :param parameters_file_name: Name of the parameters file to save the generated parameters.
     :param ignore_data: Whether to ignore existing other data present in data_folder. 
-    :param max_workers: Maximum number of worker processes to use for parallel geometry generation.
+    :param max_workers: Maximum number of worker threads to use for parallel geometry generation.
     :return: None
 
     .. note::
@@ -224,6 +213,11 @@ def generate_geometries(names: list[str],
         or already computed solutions, and for some reason you want to generate the geomteries 
         in that folder avoid touching every file except the "geo" subfolder the parameters file.
 
+    .. note::
+
+        Writing the geometries is I/O-bound, so it runs on threads: a number of workers around
+        twice the number of CPU cores is usually a good choice.
+
     .. note::
 
         As output you get a series of geometry files in data_folder/geo and a parameters.csv file in data_folder.
@@ -235,29 +229,36 @@ def generate_geometries(names: list[str],
     quantities = [np.linspace(r[0], r[1], n) for r, n in zip(ranges, num_points)]
     
     # Setup data folder
-    _setup_data(parameters_head=f"ID,{','.join(names)}\n",
-               parameters_file_name=parameters_file_name,
-               ignore_data=ignore_data,
-               data_folder=data_folder)
-
-    # Generate all parameter combinations
-    params = list(product(*quantities))
+    parameters_file = _setup_data(parameters_head=f"ID,{','.join(names)}\n",
+                                  parameters_file_name=parameters_file_name,
+                                  ignore_data=ignore_data,
+                                  data_folder=data_folder)
+
+    # Read the input geometry once and turn it into a template
+    with open(geometry_input, "r") as f:
+        template = _build_template(f.read(), names)
+
+    # Generate all parameter combinations as a (total, len(names)) array (same order as itertools.product)
+    grids = np.meshgrid(*quantities, indexing="ij")
+    params = np.stack([grid.ravel() for grid in grids], axis=1)
+    total = params.shape[0]
     
-    # Prepare CSV rows in parallel
-    results = []
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_generate_single_geometry, j+1, param, geometry_input, names, data_folder): j+1
-                   for j, param in enumerate(params)}
-        
-        for f in tqdm(as_completed(futures),
-                      total=len(futures),
+    # Generate the geometries in parallel
+    worker = partial(_generate_single_geometry, template=template, geo_folder=os.path.join(data_folder, "geo"))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in tqdm(executor.map(worker, range(1, total + 1), params),
+                      total=total,
+                      miniters=max(1, total // 200),
+                      mininterval=0.2,
                       desc="🚀 Generating geometries",
                       ncols=100,
                       bar_format="{desc} |{bar}| {percentage:3.0f}% [{n}/{total}] ⏱️ {elapsed} ETA {remaining}",
                       colour='blue'):
-            results.append(f.result())
-
-    # Write all CSV rows at once
-    with open(os.path.join(data_folder, parameters_file_name), "a") as csv_file:
-        csv_file.writelines(results)
-                                    
+            pass
+
+    # Append all the CSV rows at once (IDs followed by the full precision parameter values)
+    with open(parameters_file, "ab") as csv_file:
+        np.savetxt(csv_file,
+                   np.column_stack([np.arange(1, total + 1), params]),
+                   fmt=["%d"] + ["%.17g"] * len(names),
+                   delimiter=",")
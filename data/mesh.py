@@ -1,30 +1,93 @@
 import gmsh
 import os
+import shutil
+import atexit
 from pathlib import Path
 from tqdm import tqdm
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 
-def remove_msh_files(data_folder: str = "test") -> None:
+def _walk_msh_files(folder: str):
+    """
+    .. admonition:: Description
+
+        Recursively yield the paths of all .msh files inside a folder.
+
+    :param folder: Path to the folder to scan.
+    :return: Generator of .msh file paths.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_msh_files(entry.path)
+            elif entry.name.endswith('.msh'):
+                yield entry.path
+
+
+def _remove_file(file_path: str, verbose: bool = False) -> bool:
+    """
+    .. admonition:: Description
+
+        Remove a single file, reporting (instead of raising) any error.
+
+    :param file_path: Path to the file to remove.
+    :param verbose: Whether to print the removed file.
+    :return: Whether the file was removed.
+    """
+    try:
+        os.unlink(file_path)
+    except Exception as e:
+        print(f"Error removing {file_path}: {e}")
+        return False
+    if verbose:
+        print(f"Removed: {file_path}")
+    return True
+
+
+def remove_msh_files(data_folder: str = "test", verbose: bool = False, max_workers: int = 16) -> None:
     """
     .. admonition:: Description
 
         Remove all .msh files from the msh folder.
 
     :param data_folder: Path to the data folder.
-    """
+    :param verbose: Whether to print every removed file instead of a single summary line.
+    :param max_workers: Maximum number of threads removing the files concurrently.
 
+    .. note::
 
+        Removing a file is I/O-bound (and releases the GIL), so overlapping the removals on threads
+        pays off especially on network filesystems, where each of them costs a round trip.
+    """
     msh_folder = os.path.join(data_folder, "msh")
-    for root, _, files in os.walk(msh_folder):
-        for file in files:
-            if file.endswith('.msh'):
-                file_path = os.path.join(root, file)
-                try:
-                    os.remove(file_path)
-                    print(f"Removed: {file_path}")
-                except Exception as e:
-                    print(f"Error removing {file_path}: {e}")
+    if not os.path.isdir(msh_folder):
+        return
+    file_paths = list(_walk_msh_files(msh_folder))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        removed = sum(executor.map(partial(_remove_file, verbose=verbose), file_paths))
+    print(f"Removed {removed} .msh files from {msh_folder}")
+
+
+def _init_gmsh(num_threads: int = 1) -> None:
+    """
+    .. admonition:: Description
+
+        Initialize gmsh once for the whole lifetime of the current (worker) process,
+        suppressing its terminal messages and finalizing it at exit.
+
+    :param num_threads: Number of OpenMP threads gmsh can use for meshing.
+    """
+    gmsh.initialize()
+
+    # Suppress gmsh terminal messages
+    gmsh.option.setNumber("General.Terminal", 0)
+
+    # Let gmsh use its OpenMP threads (the option must be set, the default is ignored by many algorithms)
+    gmsh.option.setNumber("General.NumThreads", num_threads)
+    gmsh.option.setNumber("Mesh.MaxNumThreads2D", num_threads)
+
+    atexit.register(gmsh.finalize)
 
 
 def _generate_mesh_from_geo(file_path: str, data_folder: str = "test") -> None:
@@ -37,11 +100,9 @@ def _generate_mesh_from_geo(file_path: str, data_folder: str = "test") -> None:
     :param data_folder: Path to the data folder.
     """
 
-    # Initialize gmsh
-    gmsh.initialize()   
-
-    # Suppress gmsh terminal messages
-    gmsh.option.setNumber("General.Terminal", 0)
+    # Initialize gmsh if the process has not done it yet
+    if not gmsh.isInitialized():
+        _init_gmsh()
 
     # Load the .geo file
     gmsh.open(file_path)
@@ -58,8 +119,8 @@ def _generate_mesh_from_geo(file_path: str, data_folder: str = "test") -> None:
     # Write the mesh to a .msh file 
     gmsh.write(msh_path)
 
-    # Finalize gmsh
-    gmsh.finalize()
+    # Release the model before the next file (gmsh stays initialized)
+    gmsh.clear()
 
 
 def _generate_mesh(i: int, data_folder: str = "test") -> None:
@@ -76,42 +137,117 @@ def _generate_mesh(i: int, data_folder: str = "test") -> None:
     _generate_mesh_from_geo(geo_path, data_folder)
 
 
-def generate_meshes(data_folder: str = "test", empty_mesh_folder: bool = True, max_workers: int = 1) -> None:
+def _pending_geo_indices(data_folder: str = "test", empty_mesh_folder: bool = True) -> list[int]:
     """
     .. admonition:: Description
-        
-        Generate meshes for all geometries present in the specified directory using a variable number of workers.
+
+        Prepare the mesh folder and collect the indices of the geometries that still need a mesh.
 
     :param data_folder: Path to the data folder.
-    :param empty_mesh_folder: Whether to empty the mesh folder before generating new meshes.
-    :param max_workers: Maximum number of worker processes to use for parallel mesh generation.
+    :param empty_mesh_folder: Whether to empty the mesh folder before collecting the geometries.
+    :return: Indices of the geometries without a corresponding mesh.
     """
-
     msh_output_folder = Path(f"{data_folder}/msh")
     geo_folder_path = Path(f"{data_folder}/geo")
 
-    # Empty mesh directory if it exists, else create it
-    if empty_mesh_folder and msh_output_folder.exists():
-        for file in msh_output_folder.iterdir():
-            if file.is_file():
-                file.unlink()
+    # Empty mesh directory if it exists (removing it in one go), else create it
+    if empty_mesh_folder:
+        shutil.rmtree(msh_output_folder, ignore_errors=True)
     msh_output_folder.mkdir(parents=True, exist_ok=True)
 
-    # Get list of .geo files
-    geos = [geo for geo in geo_folder_path.iterdir() if geo.suffix == ".geo"]
+    # Collect the names of the existing meshes in a single pass (none if the folder was just emptied)
+    if empty_mesh_folder:
+        existing = set()
+    else:
+        with os.scandir(msh_output_folder) as entries:
+            existing = {entry.name[:-4] for entry in entries if entry.name.endswith(".msh") and entry.is_file()}
 
     # Process only the geometries that don't have a corresponding mesh yet
-    geos = [geo for geo in geos if not (msh_output_folder / f"{geo.stem}.msh").exists()]
-    geo_indices = [int(geo.stem) for geo in geos]
-
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(_generate_mesh, idx, data_folder): idx for idx in geo_indices}
-        for f in tqdm(
-            as_completed(futures),
-            total=len(futures),
+    with os.scandir(geo_folder_path) as entries:
+        return [int(entry.name[:-4]) for entry in entries
+                if entry.name.endswith(".geo") and entry.name[:-4] not in existing and entry.is_file()]
+
+
+def generate_meshes(data_folder: str = "test", empty_mesh_folder: bool = True, max_workers: int = 1, num_threads: int = None) -> None:
+    """
+    .. admonition:: Description
+        
+        Generate meshes for all geometries present in the specified directory using a variable number of workers.
+
+    :param data_folder: Path to the data folder.
+    :param empty_mesh_folder: Whether to empty the mesh folder before generating new meshes.
+    :param max_workers: Maximum number of worker processes to use for parallel mesh generation.
+    :param num_threads: Number of gmsh threads per worker process.
+
+    .. note::
+
+        If ``num_threads`` is ``None``, the available cores are split evenly among the worker processes,
+        to avoid oversubscribing the machine.
+    """
+    if num_threads is None:
+        num_threads = max(1, (os.cpu_count() or 1) // max_workers)
+
+    geo_indices = _pending_geo_indices(data_folder, empty_mesh_folder)
+
+    # Send the geometries to the workers in chunks
+    chunksize = max(1, len(geo_indices) // (max_workers * 4))
+    worker = partial(_generate_mesh, data_folder=data_folder)
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_gmsh, initargs=(num_threads,)) as executor:
+        for _ in tqdm(
+            executor.map(worker, geo_indices, chunksize=chunksize),
+            total=len(geo_indices),
+            miniters=max(1, len(geo_indices) // 200),
+            mininterval=0.2,
             desc="🚀 Generating meshes",
             ncols=100,
             bar_format="{desc} |{bar}| {percentage:3.0f}% [{n}/{total}] ⏱️ {elapsed} ETA {remaining}",
             colour='blue'
         ):
-            _ = f.result()
\ No newline at end of file
+            pass
+
+
+def generate_meshes_mpi(data_folder: str = "test", empty_mesh_folder: bool = True, num_threads: int = 1) -> None:
+    """
+    .. admonition:: Description
+
+        Generate meshes for all geometries present in the specified directory, distributing them
+        among the MPI ranks (possibly on different nodes) instead of local worker processes.
+
+    :param data_folder: Path to the data folder.
+    :param empty_mesh_folder: Whether to empty the mesh folder before generating new meshes.
+    :param num_threads: Number of gmsh threads per rank.
+
+    .. note::
+
+        It must be called by every rank, e.g. launching the script with ``mpiexec -n <ranks>``.
+        Rank 0 collects the geometries and each rank meshes a static share of them,
+        since the geometries are independent of each other.
+    """
+    from mpi4py import MPI
+
+    comm = MPI.COMM_WORLD
+    rank, size = comm.Get_rank(), comm.Get_size()
+
+    # Only rank 0 touches the mesh folder, then it shares the geometries to process
+    geo_indices = _pending_geo_indices(data_folder, empty_mesh_folder) if rank == 0 else None
+    geo_indices = comm.bcast(geo_indices, root=0)
+    local_indices = geo_indices[rank::size]
+
+    # Keep gmsh alive on this rank for the whole run
+    _init_gmsh(num_threads)
+
+    for i in tqdm(
+        local_indices,
+        disable=rank != 0,
+        miniters=max(1, len(local_indices) // 200),
+        mininterval=0.2,
+        desc="🚀 Generating meshes",
+        ncols=100,
+        bar_format="{desc} |{bar}| {percentage:3.0f}% [{n}/{total}] ⏱️ {elapsed} ETA {remaining}",
+        colour='blue'
+    ):
+        _generate_mesh(i, data_folder)
+
+    # Wait for all the ranks to finish
+    comm.Barrier()
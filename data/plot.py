@@ -1,9 +1,77 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.tri as tri
-from matplotlib.colors import BoundaryNorm
+from matplotlib.colors import BoundaryNorm, Normalize
+from matplotlib.collections import LineCollection, PolyCollection
 import math
 import h5py
+from functools import lru_cache
+import os
+import weakref
+
+
+# Figure shared by the exported plots (see _get_fig)
+_FIG = None
+
+# Vertex coordinates of the cells of each triangulation (see _cell_vertices)
+_CELL_VERTICES = weakref.WeakKeyDictionary()
+
+# Datasets of a solution file used by the plots
+_PLOT_DATASETS = ("x", "y", "cells", "boundary_edges", "potential", "potential_pred", "se", "ae", "grad_x", "grad_y",
+                  "normal_derivatives_plate", "normal_derivative_pred", "midpoints_plate", "normal_vectors_plate")
+
+
+@lru_cache(maxsize=32)
+def _sharp_norm(sol_min: float, sol_max: float, sharp_color_range: tuple, outside_sharpness: int) -> BoundaryNorm:
+    """
+    .. admonition:: Description
+
+        It builds (once per set of arguments) the color normalization with sharp transitions
+        in the specified range.
+
+    :param sol_min: Minimum value of the plotted quantity.
+    :param sol_max: Maximum value of the plotted quantity.
+    :param sharp_color_range: Range where to create sharp color transitions.
+    :param outside_sharpness: Number of color levels outside the sharp color range.
+    :return: Color normalization, whose ``boundaries`` are read-only since they are shared among the calls.
+    """
+    # Fill the boundaries in place, with a single allocation
+    bounds = np.empty(2 * outside_sharpness + 150)
+    bounds[:outside_sharpness] = np.linspace(sol_min, sharp_color_range[0], outside_sharpness, endpoint=False)
+    bounds[outside_sharpness:outside_sharpness + 150] = np.linspace(sharp_color_range[0], sharp_color_range[1], 150)
+    bounds[outside_sharpness + 150:] = np.linspace(sharp_color_range[1], sol_max, outside_sharpness)
+    bounds.setflags(write=False)
+    return BoundaryNorm(boundaries=bounds, ncolors=256, clip=True)
+
+
+def _cell_vertices(triang: tri.Triangulation) -> np.ndarray:
+    """
+    .. admonition:: Description
+
+        It returns the coordinates of the vertices of each cell, computing them once per triangulation.
+
+    :param triang: Triangulation of the mesh.
+    :return: Array of shape (number of cells, 3, 2) with the vertex coordinates of each cell.
+    """
+    vertices = _CELL_VERTICES.get(triang)
+    if vertices is None:
+        vertices = np.stack([triang.x[triang.triangles], triang.y[triang.triangles]], axis=-1)
+        _CELL_VERTICES[triang] = vertices
+    return vertices
+
+
+def _plot_mesh(triang: tri.Triangulation) -> None:
+    """
+    .. admonition:: Description
+
+        It overlays the edges of the mesh on the current axes as a single (rasterized) line collection.
+
+    :param triang: Triangulation of the mesh.
+    """
+    segments = np.stack([triang.x[triang.edges], triang.y[triang.edges]], axis=-1)
+    ax = plt.gca()
+    ax.add_collection(LineCollection(segments, colors='lightgrey', linewidths=0.5, alpha=0.5, rasterized=True))
+    ax.autoscale_view()
 
 
 def _cells_plot(x: np.ndarray,
@@ -18,7 +86,8 @@ def _cells_plot(x: np.ndarray,
                sharp_color_range: tuple = None,
                outside_sharpness: int = 50,
                plot_triangulation: bool = True,
-               postpone_show: bool = False) -> None:
+               postpone_show: bool = False,
+               triang: tri.Triangulation = None) -> None:
     """
     .. admonition:: Description
         
@@ -37,41 +106,41 @@ def _cells_plot(x: np.ndarray,
     :param outside_sharpness: Number of color levels outside the sharp color range.
     :param plot_triangulation: Whether to overlay the mesh triangulation.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
     """
     
-    # Create triangulation object
-    triang = tri.Triangulation(x, y, triangles = cells)
+    # Create triangulation object (if not provided)
+    if triang is None:
+        triang = tri.Triangulation(x, y, triangles = cells)
+
+    # Single precision is enough for the color mapping of the cells
+    sol = np.ascontiguousarray(sol, dtype=np.float32)
 
-    # Plot the solution using tripcolor
+    # Define custom color normalization with sharp transitions in specified range
+    norm = None
     if sharp_color_range is not None:
-        # Define custom color normalization with sharp transitions in specified range
-        bounds = np.concatenate([
-            np.linspace(sol.min(), sharp_color_range[0], outside_sharpness, endpoint=False),
-            np.linspace(sharp_color_range[0], sharp_color_range[1], 150),
-            np.linspace(sharp_color_range[1], sol.max(), outside_sharpness)
-        ])
-        norm = BoundaryNorm(boundaries=bounds, ncolors=256, clip=True)
-        plt.tripcolor(
-            triang,
-            facecolors=sol,
-            shading='flat',
-            cmap=cmap,
-            norm=norm,
-        )
-    else:
-        plt.tripcolor(
-            triang,
-            facecolors=sol,
-            shading='flat',
-            cmap=cmap
-        )
+        norm = _sharp_norm(float(sol.min()), float(sol.max()), tuple(sharp_color_range), outside_sharpness)
+
+    # Plot the solution as flat colored cells (like tripcolor), reusing the cell vertices of the mesh
+    cell_plot = PolyCollection(
+        _cell_vertices(triang),
+        array=sol,
+        cmap=cmap,
+        norm=norm,
+        edgecolors='none',
+        antialiased=False,
+        rasterized=True
+    )
+    ax = plt.gca()
+    ax.add_collection(cell_plot)
+    ax.autoscale_view()
     # plot also the connectivity (mesh)
     if plot_triangulation:
-        plt.triplot(triang, color='lightgrey', linewidth=0.5, alpha=0.5)
+        _plot_mesh(triang)
     plt.title(title)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
-    plt.colorbar(label=colorbar_label)
+    plt.colorbar(cell_plot, label=colorbar_label)
     if not postpone_show:
         plt.show()
 
@@ -88,7 +157,9 @@ def _vertices_plot(x: np.ndarray,
                   sharp_color_range: tuple = None, 
                   outside_sharpness: int = 50,
                   plot_triangulation: bool = True,
-                  postpone_show: bool = False) -> None:
+                  postpone_show: bool = False,
+                  triang: tri.Triangulation = None,
+                  levels: int = 64) -> None:
     """
     .. admonition:: Description
         
@@ -107,35 +178,36 @@ def _vertices_plot(x: np.ndarray,
     :param outside_sharpness: Number of color levels outside the sharp color range.
     :param plot_triangulation: Whether to overlay the mesh triangulation.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
+    :param levels: Number of contour levels (ignored when ``sharp_color_range`` is given, since the color boundaries are used).
     """
     
-    triang = tri.Triangulation(x, y, triangles = cells)
+    if triang is None:
+        triang = tri.Triangulation(x, y, triangles = cells)
 
     if sharp_color_range is not None:
-        bounds = np.concatenate([
-            np.linspace(sol.min(), sharp_color_range[0], outside_sharpness, endpoint=False),
-            np.linspace(sharp_color_range[0], sharp_color_range[1], 150),
-            np.linspace(sharp_color_range[1], sol.max(), outside_sharpness)
-        ])
-        norm = BoundaryNorm(boundaries=bounds, ncolors=256, clip=True)
+        norm = _sharp_norm(float(sol.min()), float(sol.max()), tuple(sharp_color_range), outside_sharpness)
         plt.tricontourf(
             triang,
             sol,
-            levels=256,
+            # Contour exactly at the color boundaries (levels must be strictly increasing)
+            levels=np.unique(norm.boundaries),
             cmap=cmap,
             norm=norm,
+            rasterized=True,
         )
     else:
         plt.tricontourf(
             triang,
             sol,
-            levels=256,
-            cmap=cmap
+            levels=levels,
+            cmap=cmap,
+            rasterized=True
         )
 
     # plot also the connectivity (mesh)
     if plot_triangulation:
-        plt.triplot(triang, color='lightgrey', linewidth=0.5, alpha=0.5)
+        _plot_mesh(triang)
     plt.title(title)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
@@ -151,7 +223,9 @@ def domain_plot(x: np.ndarray,
             xlabel: str ="x",
             ylabel: str ="y",
             plot_triangulation: bool = True,
-            postpone_show: bool = False) -> None:
+            postpone_show: bool = False,
+            triang: tri.Triangulation = None,
+            boundary_edges: np.ndarray = None) -> None:
     """
     .. admonition:: Description
         
@@ -165,32 +239,35 @@ def domain_plot(x: np.ndarray,
     :param ylabel: Label for the y-axis.
     :param plot_triangulation: Whether to overlay the mesh triangulation.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
+    :param boundary_edges: Optional precomputed boundary edges (pairs of vertex indices), to skip their extraction.
     """
-    triang = tri.Triangulation(x, y, triangles = cells)
-    triangles = triang.triangles
-    neighbors = triang.neighbors
+    if triang is None:
+        triang = tri.Triangulation(x, y, triangles = cells)
 
     # plot also the connectivity (mesh)
     if plot_triangulation:
-        plt.triplot(triang, color='lightgrey', linewidth=0.5, alpha=0.5)
-
-    boundary_edges = []
-
-    # Each triangle has 3 edges.
-    # If a neighbor is -1, that edge is on the boundary.
-    for t_idx, tri_nodes in enumerate(triangles):
-        for edge_local, neigh in enumerate(neighbors[t_idx]):
-            if neigh == -1:  # boundary edge
-                i = tri_nodes[edge_local]
-                j = tri_nodes[(edge_local + 1) % 3]
-                boundary_edges.append((i, j))
-
-    # Remove duplicates while keeping order
-    boundary_edges = list(dict.fromkeys(tuple(sorted(e)) for e in boundary_edges))
-
-    # Plot ONLY boundary
-    for i, j in boundary_edges:
-        plt.plot([x[i], x[j]], [y[i], y[j]], color='black', linewidth=1.0)
+        _plot_mesh(triang)
+
+    if boundary_edges is None:
+        triangles = triang.triangles
+        neighbors = triang.neighbors
+
+        # Each triangle has 3 edges.
+        # If a neighbor is -1, that edge is on the boundary.
+        tri_idx, edge_local = np.nonzero(neighbors == -1)
+        i = triangles[tri_idx, edge_local]
+        j = triangles[tri_idx, (edge_local + 1) % 3]
+
+        # Remove duplicates, packing each (sorted) edge into a single 64 bit key
+        keys = np.unique((np.minimum(i, j).astype(np.uint64) << np.uint64(32)) | np.maximum(i, j).astype(np.uint64))
+        boundary_edges = np.stack([keys >> np.uint64(32), keys & np.uint64(0xFFFFFFFF)], axis=1).astype(np.int64)
+
+    # Plot ONLY boundary (all the edges as a single collection)
+    segments = np.stack([triang.x[boundary_edges], triang.y[boundary_edges]], axis=-1)
+    ax = plt.gca()
+    ax.add_collection(LineCollection(segments, colors='black', linewidths=1.0))
+    ax.autoscale_view()
         
     plt.title(title)
     plt.xlabel(xlabel)
@@ -199,6 +276,23 @@ def domain_plot(x: np.ndarray,
         plt.show()
 
 
+def _cells_to_vertices(cells: np.ndarray, sol: np.ndarray, num_vertices: int) -> np.ndarray:
+    """
+    .. admonition:: Description
+
+        It averages a cell-based quantity onto the vertices, each vertex taking the mean value of the cells it belongs to.
+
+    :param cells: Connectivity of the mesh cells.
+    :param sol: Quantity defined per cell.
+    :param num_vertices: Number of vertices of the mesh.
+    :return: Quantity defined per vertex.
+    """
+    vertices = np.asarray(cells).ravel()
+    totals = np.bincount(vertices, weights=np.repeat(sol, cells.shape[1]), minlength=num_vertices)
+    counts = np.bincount(vertices, minlength=num_vertices)
+    return totals / np.maximum(counts, 1)
+
+
 def plot(x: np.ndarray, 
          y: np.ndarray, 
          cells: np.ndarray, 
@@ -211,7 +305,10 @@ def plot(x: np.ndarray,
          sharp_color_range: tuple = None,
          outside_sharpness: int = 50,
          plot_triangulation: bool = True,
-         postpone_show: bool = False) -> None:
+         postpone_show: bool = False,
+         triang: tri.Triangulation = None,
+         interpolate_cells: bool = False,
+         boundary_edges: np.ndarray = None) -> None:
     """
     .. admonition:: Description
         
@@ -230,35 +327,46 @@ def plot(x: np.ndarray,
     :param outside_sharpness: Number of color levels outside the sharp color range.
     :param plot_triangulation: Whether to overlay the mesh triangulation.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
+    :param interpolate_cells: Whether to average a cell-based solution onto the vertices and plot it with contours,
+        which is faster than drawing every cell on very large meshes, but smooths the jumps between cells.
+    :param boundary_edges: Optional precomputed boundary edges, used when plotting only the domain.
     
     .. note::
         
         If you set the solution to None you can plot only the domain.
     """
 
+    nx, ny, nc = len(x), len(y), len(cells)
+    ns = None if sol is None else len(sol)
+
     # Check validity of input data
-    if len(x) == 0 or len(y) == 0 or len(cells) == 0 or (sol is not None and len(sol) == 0):
+    if nx == 0 or ny == 0 or nc == 0 or ns == 0:
         print("No data to plot.")
         return
     
-    if len(x) != len(y):
+    if nx != ny:
         print("Inconsistent lengths between x and y coordinates.")
-        if sol is not None and len(x) != len(sol):
-            # check if the solution is given in terms of cells
-            if len(cells) % len(sol) != 0:
-                print("Inconsistent data lengths between coordinates and solution.")
-                return
+        return
+
+    # The solution must be given either per cell or per vertex
+    if ns is not None and ns != nc and ns != nx:
+        print("Inconsistent data lengths between coordinates and solution.")
         return
     
-    if sol is None:
+    if ns is None:
         # Plot only the domain
-        domain_plot(x, y, cells, title, xlabel, ylabel, plot_triangulation, postpone_show)
-    elif len(cells) % len(sol) == 0:
+        domain_plot(x, y, cells, title, xlabel, ylabel, plot_triangulation, postpone_show, triang, boundary_edges)
+    elif ns == nc and interpolate_cells:
+        # Plot using the vertices, after averaging the cell values onto them
+        sol = _cells_to_vertices(cells, sol, nx)
+        _vertices_plot(x, y, cells, sol, title, xlabel, ylabel, colorbar_label, cmap, sharp_color_range, outside_sharpness, plot_triangulation, postpone_show, triang)
+    elif ns == nc:
         # Plot using the cells
-        _cells_plot(x, y, cells, sol, title, xlabel, ylabel, colorbar_label, cmap, sharp_color_range, outside_sharpness, plot_triangulation, postpone_show)
+        _cells_plot(x, y, cells, sol, title, xlabel, ylabel, colorbar_label, cmap, sharp_color_range, outside_sharpness, plot_triangulation, postpone_show, triang)
     else:
         # Plot using the vertices
-        _vertices_plot(x, y, cells, sol, title, xlabel, ylabel, colorbar_label, cmap, sharp_color_range, outside_sharpness, plot_triangulation, postpone_show)
+        _vertices_plot(x, y, cells, sol, title, xlabel, ylabel, colorbar_label, cmap, sharp_color_range, outside_sharpness, plot_triangulation, postpone_show, triang)
 
 
 def _zoom_around(ax: plt.Axes, x0: float, y0: float, zoom: float) -> None:
@@ -282,39 +390,129 @@ def _zoom_around(ax: plt.Axes, x0: float, y0: float, zoom: float) -> None:
     ax.set_ylim(y0 - height/2, y0 + height/2)
 
 
+def _get_fig() -> plt.Figure:
+    """
+    .. admonition:: Description
+
+        It returns a figure shared by all the exported plots of the process, creating it on the first call,
+        so that the cost of creating a new figure is paid only once.
+
+    :return: The shared figure.
+    """
+    global _FIG
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG = plt.figure()
+    return _FIG
+
+
+def _prepare_axes(n: int, zoom: list[int] = None, center_points: list[tuple] = None, fig: plt.Figure = None) -> tuple:
+    """
+    .. admonition:: Description
+
+        It checks the zoom levels and center points, normalizing them into arrays, and creates a grid of axes
+        for the given number of subplots (one per zoom level).
+
+    :param n: Number of subplots.
+    :param zoom: Optional list of zoom levels for different subplots.
+    :param center_points: Optional list of center points :math:`(x_0, y_0)` for each zoom level.
+    :param fig: Optional figure to clear and reuse instead of creating a new one.
+    :returns:
+        - **fig** (``plt.Figure``) -- Figure containing the subplots
+        - **axes** (``np.ndarray``) -- Flattened array of axes
+        - **zooms** (``np.ndarray``) -- Zoom level of each subplot (1 if not given)
+        - **centers** (``np.ndarray``) -- Zoom center of each subplot, with shape (n, 2) (the origin if not given)
+
+    :raises ValueError: If the number of center points does not match the number of zoom levels.
+    """
+    if center_points is not None and len(center_points) != n:
+        raise ValueError("Length of center_points must match number of zoom levels.")
+    zooms = np.ones(n) if zoom is None else np.asarray(zoom, dtype=float)
+    centers = np.zeros((n, 2)) if center_points is None else np.asarray(center_points, dtype=float).reshape(-1, 2)
+    rows = max(1, math.floor(math.sqrt(n) * 0.75))
+    cols = math.ceil(n / rows)
+    if fig is None:
+        fig = plt.figure(figsize=(5 * cols, 5 * rows))
+    else:
+        fig.clf()
+        fig.set_size_inches(5 * cols, 5 * rows)
+    axes = fig.subplots(rows, cols, squeeze=False).flatten()
+    return fig, axes, zooms, centers
+
+
+def _zoom_subplot(ax: plt.Axes, zoom: float, center: np.ndarray) -> None:
+    """
+    .. admonition:: Description
+
+        It applies the given zoom level to the axes, keeping an equal aspect ratio.
+
+    :param ax: The axes object to apply the zoom on.
+    :param zoom: Zoom factor.
+    :param center: Zoom center :math:`(x_0, y_0)`.
+    """
+    _zoom_around(ax, x0=center[0], y0=center[1], zoom=zoom)
+    ax.set_aspect('equal', adjustable='datalim')
+
+
+def _load_datasets(file: h5py.File) -> dict:
+    """
+    .. admonition:: Description
+
+        It reads all the datasets used by the plots (the ones present in the file) in one go,
+        so that several plots can share them without going back to the file.
+
+    :param file: h5py file object containing the solution data.
+    :return: Dictionary mapping the dataset names to their arrays, usable in place of the file by the plots.
+    """
+    return {key: file[key][:] for key in _PLOT_DATASETS if key in file}
+
+
+def _load_mesh(file: h5py.File) -> tuple:
+    """
+    .. admonition:: Description
+
+        It reads the mesh from the given file, so that it can be loaded once and shared among the plots.
+
+    :param file: h5py file object containing the solution data.
+    :returns:
+        - **x** (``np.ndarray``) -- x coordinates of the vertices
+        - **y** (``np.ndarray``) -- y coordinates of the vertices
+        - **cells** (``np.ndarray``) -- Connectivity of the mesh cells
+    """
+    return file["x"][:], file["y"][:], file["cells"][:]
+
+
 def plot_domain(file: h5py.File, 
                 postpone_show=False, 
                 zoom: list[int] = None, 
-                center_points: list[tuple] = None) -> None:
+                center_points: list[tuple] = None,
+                triang: tri.Triangulation = None,
+                fig: plt.Figure = None) -> None:
     """
     .. admonition:: Description
         
         It plots the domain and the mesh.
         
-    :param file: h5py file object containing the solution data.
+    :param file: h5py file object (or dictionary of arrays, see :func:`_load_datasets`) containing the solution data.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
     :param zoom: List of zoom levels for different subplots.
     :param center_points: List of center points :math:`(x_0, y_0)` for each zoom level.
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
+    :param fig: Optional figure to clear and reuse instead of creating a new one.
     """
     n = 1 if zoom is None else len(zoom)
-    if n > 1:
-        rows = max(1, math.floor(math.sqrt(n) * 0.75))
-        cols = math.ceil(n / rows)
-        fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 5 * rows))
-        axes = axes.flatten() if isinstance(axes, np.ndarray) else [axes]
-    else:
-        fig, ax = plt.subplots(figsize=(5, 5))
-        axes = [ax]
-
-    if center_points is not None and len(center_points) != n:
-        raise ValueError("Length of center_points must match number of zoom levels.")
+    if triang is None:
+        triang = tri.Triangulation(*_load_mesh(file))
+    x, y, cells = triang.x, triang.y, triang.triangles
+    fig, axes, zooms, centers = _prepare_axes(n, zoom, center_points, fig)
 
+    # Use the boundary edges stored with the solution, if any
+    boundary_edges = file["boundary_edges"][:] if "boundary_edges" in file else None
     for i in range(n):
         plt.sca(axes[i])
         plot(
-            x=file["x"][:],
-            y=file["y"][:],
-            cells=file["cells"][:],
+            x=x,
+            y=y,
+            cells=cells,
             sol=None,
             title="Domain and mesh (zoom {})".format(zoom[i]) if zoom is not None else "Domain and mesh",
             xlabel="x",
@@ -323,15 +521,11 @@ def plot_domain(file: h5py.File,
             cmap='RdBu_r',
             sharp_color_range=None,
             plot_triangulation=True,
-            postpone_show=postpone_show
-        )
-        _zoom_around(
-            axes[i],
-            x0=center_points[i][0] if center_points is not None else 0,
-            y0=center_points[i][1] if center_points is not None else 0,
-            zoom=zoom[i] if zoom is not None else 1
+            postpone_show=postpone_show,
+            triang=triang,
+            boundary_edges=boundary_edges
         )
-        axes[i].set_aspect('equal', adjustable='datalim')
+        _zoom_subplot(axes[i], zooms[i], centers[i])
 
     plt.tight_layout()
     if not postpone_show:
@@ -344,44 +538,44 @@ def plot_potential(file: h5py.File,
                    center_points: list[tuple] = None, 
                    pred: bool = False, 
                    error: bool = False, 
-                   error_type: str ="se") -> None:
+                   error_type: str ="se",
+                   triang: tri.Triangulation = None,
+                   fig: plt.Figure = None) -> None:
     """
     .. admonition:: Description
         
         It plots the electrostatic potential over the domain.
         
-    :param file: h5py file object containing the solution data.
+    :param file: h5py file object (or dictionary of arrays, see :func:`_load_datasets`) containing the solution data.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
     :param zoom: List of zoom levels for different subplots.
     :param center_points: List of center points :math:`(x_0, y_0)` for each zoom level.
     :param pred: Whether to plot the predicted potential.
     :param error: Whether to plot the error in potential prediction.
     :param error_type: Type of error to plot ("se" for squared error, "ae" for absolute error).
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
+    :param fig: Optional figure to clear and reuse instead of creating a new one.
     """
     n = 1 if zoom is None else len(zoom)
+    if triang is None:
+        triang = tri.Triangulation(*_load_mesh(file))
+    x, y, cells = triang.x, triang.y, triang.triangles
     if pred and error:
         raise ValueError("Cannot set both pred and error to True.")
+    if error and error_type not in ["se", "ae"]:
+        raise ValueError("error_type must be either 'se' (squared error) or 'ae' (absolute error).")
+    fig, axes, zooms, centers = _prepare_axes(n, zoom, center_points, fig)
     if not error:
-        if n > 1:
-            rows = max(1, math.floor(math.sqrt(n) * 0.75))
-            cols = math.ceil(n / rows)
-            fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 5 * rows))
-            axes = axes.flatten() if isinstance(axes, np.ndarray) else [axes]
+        if pred:
+            sol = file["potential_pred"][:]
         else:
-            fig, ax = plt.subplots(figsize=(5, 5))
-            axes = [ax]
-        if center_points is not None and len(center_points) != n:
-            raise ValueError("Length of center_points must match number of zoom levels.")
+            sol = file["potential"][:]
         for i in range(n):
             plt.sca(axes[i])
-            if pred:
-                sol = file["potential_pred"][:]
-            else:
-                sol = file["potential"][:]
             plot(
-                x = file["x"][:],
-                y = file["y"][:],
-                cells = file["cells"][:],
+                x = x,
+                y = y,
+                cells = cells,
                 sol = sol,
                 title ="Electrostatic potential (zoom {})".format(zoom[i]) if zoom is not None else "Electrostatic potential", 
                 xlabel ="x",
@@ -390,79 +584,56 @@ def plot_potential(file: h5py.File,
                 cmap ='RdBu_r',
                 sharp_color_range = None,
                 plot_triangulation = True,
-                postpone_show = postpone_show
-            )
-            _zoom_around(
-                axes[i],
-                x0=center_points[i][0] if center_points is not None else 0,
-                y0=center_points[i][1] if center_points is not None else 0,
-                zoom=zoom[i] if zoom is not None else 1
+                postpone_show = postpone_show,
+                triang = triang
             )
+            _zoom_subplot(axes[i], zooms[i], centers[i])
             # specifcy its a prediction
             if pred:
                 axes[i].set_title("Predicted electrostatic potential (zoom {})".format(zoom[i]) if zoom is not None else "Predicted potential")
-            axes[i].set_aspect('equal', adjustable='datalim')
     else:
-        if n > 1:
-            rows = max(1, math.floor(math.sqrt(n) * 0.75))
-            cols = math.ceil(n / rows)
-            fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 5 * rows))
-            axes = axes.flatten() if isinstance(axes, np.ndarray) else [axes]
-        else:
-            fig, ax = plt.subplots(figsize=(5, 5))
-            axes = [ax]
-        if center_points is not None and len(center_points) != n:
-            raise ValueError("Length of center_points must match number of zoom levels.")
-        if error_type not in ["se", "ae"]:
-            raise ValueError("error_type must be either 'se' (squared error) or 'ae' (absolute error).")
         if error_type == "se":
+            se = file["se"][:]
+            rmse = np.sqrt(np.mean(se))
             for i in range(n):
                 plt.sca(axes[i])
                 plot(
-                    x = file["x"][:],
-                    y = file["y"][:],
-                    cells = file["cells"][:],
-                    sol = file["se"][:],
-                    title ="Squared error (RMSE {:.2e}) (zoom {})".format(np.sqrt(np.mean(file["se"][:])), zoom[i]) if zoom is not None else "Squared error (RMSE {:.2e})".format(np.sqrt(np.mean(file["se"][:]))), 
+                    x = x,
+                    y = y,
+                    cells = cells,
+                    sol = se,
+                    title ="Squared error (RMSE {:.2e}) (zoom {})".format(rmse, zoom[i]) if zoom is not None else "Squared error (RMSE {:.2e})".format(rmse), 
                     xlabel ="x",
                     ylabel ="y",
                     colorbar_label ="Squared Error",
                     cmap ='RdBu_r',
                     sharp_color_range = None,
                     plot_triangulation = True,
-                    postpone_show = postpone_show
-                )
-                _zoom_around(
-                    axes[i],
-                    x0=center_points[i][0] if center_points is not None else 0,
-                    y0=center_points[i][1] if center_points is not None else 0,
-                    zoom=zoom[i] if zoom is not None else 1
+                    postpone_show = postpone_show,
+                    triang = triang
                 )
-                axes[i].set_aspect('equal', adjustable='datalim')
+                _zoom_subplot(axes[i], zooms[i], centers[i])
         else:
+            ae = file["ae"][:]
+            mae = np.mean(ae)
             for i in range(n):
                 plt.sca(axes[i])
                 plot(
-                    x = file["x"][:],
-                    y = file["y"][:],
-                    cells = file["cells"][:],
-                    sol = file["ae"][:],
-                    title ="Absolute error (MAE {:.2e}) (zoom {})".format(np.mean(file["ae"][:]), zoom[i]) if zoom is not None else "Absolute error (MAE {:.2e})".format(np.mean(file["ae"][:])),
+                    x = x,
+                    y = y,
+                    cells = cells,
+                    sol = ae,
+                    title ="Absolute error (MAE {:.2e}) (zoom {})".format(mae, zoom[i]) if zoom is not None else "Absolute error (MAE {:.2e})".format(mae),
                     xlabel ="x",
                     ylabel ="y",
                     colorbar_label ="Absolute Error",
                     cmap ='RdBu_r',
                     sharp_color_range = None,
                     plot_triangulation = True,
-                    postpone_show = postpone_show
+                    postpone_show = postpone_show,
+                    triang = triang
                 )
-                _zoom_around(
-                    axes[i],
-                    x0=center_points[i][0] if center_points is not None else 0,
-                    y0=center_points[i][1] if center_points is not None else 0,
-                    zoom=zoom[i] if zoom is not None else 1
-                )
-                axes[i].set_aspect('equal', adjustable='datalim')
+                _zoom_subplot(axes[i], zooms[i], centers[i])
 
     plt.tight_layout()
     if not postpone_show:
@@ -473,37 +644,36 @@ def plot_grad(file: h5py.File,
               postpone_show=False, 
               zoom: list[int] = None, 
               center_points: list[tuple] = None, 
-              component: str ="x"):
+              component: str ="x",
+              triang: tri.Triangulation = None,
+              fig: plt.Figure = None):
     """
     .. admonition:: Description
         
         It plots the x component of the gradient of the electrostatic potential.
         
-    :param file: h5py file object containing the solution data.
+    :param file: h5py file object (or dictionary of arrays, see :func:`_load_datasets`) containing the solution data.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
     :param zoom: List of zoom levels for different subplots.
     :param center_points: List of center points :math:`(x_0, y_0)` for each zoom level.
     :param component: Component of the gradient to plot ("x" or "y").
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
+    :param fig: Optional figure to clear and reuse instead of creating a new one.
     """
     n = 1 if zoom is None else len(zoom)
-    if n > 1:
-        rows = max(1, math.floor(math.sqrt(n) * 0.75))
-        cols = math.ceil(n / rows)
-        fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 5 * rows))
-        axes = axes.flatten() if isinstance(axes, np.ndarray) else [axes]
-    else:
-        fig, ax = plt.subplots(figsize=(5, 5))
-        axes = [ax]
-    if center_points is not None and len(center_points) != n:
-        raise ValueError("Length of center_points must match number of zoom levels.")
+    if triang is None:
+        triang = tri.Triangulation(*_load_mesh(file))
+    x, y, cells = triang.x, triang.y, triang.triangles
+    fig, axes, zooms, centers = _prepare_axes(n, zoom, center_points, fig)
+    grad = file["grad_x"][:] if component == "x" else file["grad_y"][:]
     for i in range(n):
         plt.sca(axes[i])
         if component == "x":
             plot(
-                x = file["x"][:],
-                y = file["y"][:],
-                cells = file["cells"][:],
-                sol = file["grad_x"][:],
+                x = x,
+                y = y,
+                cells = cells,
+                sol = grad,
                 title ="grad_x (zoom {})".format(zoom[i]) if zoom is not None else "grad_x", 
                 xlabel ="x",
                 ylabel ="y",
@@ -511,14 +681,15 @@ def plot_grad(file: h5py.File,
                 cmap ='RdBu_r',
                 sharp_color_range = None,
                 plot_triangulation = True,
-                postpone_show = postpone_show
+                postpone_show = postpone_show,
+                triang = triang
             )
         else:
              plot(
-                x = file["x"][:],
-                y = file["y"][:],
-                cells = file["cells"][:],
-                sol = file["grad_y"][:],
+                x = x,
+                y = y,
+                cells = cells,
+                sol = grad,
                 title ="grad_y (zoom {})".format(zoom[i]) if zoom is not None else "grad_y", 
                 xlabel ="x",
                 ylabel ="y",
@@ -526,52 +697,60 @@ def plot_grad(file: h5py.File,
                 cmap ='RdBu_r',
                 sharp_color_range = None,
                 plot_triangulation = True,
-                postpone_show = postpone_show
+                postpone_show = postpone_show,
+                triang = triang
             )
-        _zoom_around(
-            axes[i],
-            x0=center_points[i][0] if center_points is not None else 0,
-            y0=center_points[i][1] if center_points is not None else 0,
-            zoom=zoom[i] if zoom is not None else 1
-        )
-        axes[i].set_aspect('equal', adjustable='datalim')
+        _zoom_subplot(axes[i], zooms[i], centers[i])
     plt.tight_layout()
     if not postpone_show:
         plt.show()
    
 
-def plot_normal_derivative(file, postpone_show=False, pred=False, error=False, zoom: list[int] = None, center_points: list[tuple] = None):   
+def plot_normal_derivative(file, postpone_show=False, pred=False, error=False, zoom: list[int] = None, center_points: list[tuple] = None, triang: tri.Triangulation = None, fig: plt.Figure = None):   
     """
     .. admonition:: Description
         
         It plots the normal derivative of the potential on the upper plate as arrows.
     
-    :param file: h5py file object containing the solution data.
+    :param file: h5py file object (or dictionary of arrays, see :func:`_load_datasets`) containing the solution data.
     :param postpone_show: Whether to postpone the ``plt.show()`` call.
     :param pred: Whether to plot the predicted normal derivative.
     :param error: Whether to plot the error in normal derivative prediction.
     :param zoom: List of zoom levels for different subplots.
     :param center_points: List of center points :math:`(x_0, y_0)` for each zoom level.
+    :param triang: Optional precomputed triangulation of the mesh, to share it among several plots.
+    :param fig: Optional figure to clear and reuse instead of creating a new one.
     
     :raises ValueError: If both pred and error are set to True.
     """ 
     n = 1 if zoom is None else len(zoom)
-    if n > 1:
-        rows = max(1, math.floor(math.sqrt(n) * 0.75))
-        cols = math.ceil(n / rows)
-        fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 5 * rows))
-        axes = axes.flatten() if isinstance(axes, np.ndarray) else [axes]
+    if triang is None:
+        triang = tri.Triangulation(*_load_mesh(file))
+    x, y, cells = triang.x, triang.y, triang.triangles
+    if pred and error:
+        raise ValueError("Cannot set both pred and error to True.")
+    fig, axes, zooms, centers = _prepare_axes(n, zoom, center_points, fig)
+    if pred:
+        normal_derivative = file["normal_derivative_pred"][:]
+    elif error:
+        normal_derivative = file["normal_derivative_pred"][:] - file["normal_derivatives_plate"][:]
     else:
-        fig, ax = plt.subplots(figsize=(5, 5))
-        axes = [ax]
-    if center_points is not None and len(center_points) != n:
-        raise ValueError("Length of center_points must match number of zoom levels.")
+        normal_derivative = file["normal_derivatives_plate"][:]
+    points = file["midpoints_plate"][:]
+    normals = file["normal_vectors_plate"][:]
+    U = normals[:, 0]
+    V = normals[:, 1]
+    lengths = normal_derivative
+    # The arrows of all the subplots share the same color normalization
+    norm = Normalize(vmin=float(lengths.min()), vmax=float(lengths.max()))
+    # Use the boundary edges stored with the solution, if any
+    boundary_edges = file["boundary_edges"][:] if "boundary_edges" in file else None
     for i in range(n):
         plt.sca(axes[i])
         plot(
-            x=file["x"][:],
-            y=file["y"][:],
-            cells=file["cells"][:],
+            x=x,
+            y=y,
+            cells=cells,
             sol=None,
             title="Domain and mesh (zoom {})".format(zoom[i]) if zoom is not None else "Domain and mesh",
             xlabel="x",
@@ -580,45 +759,22 @@ def plot_normal_derivative(file, postpone_show=False, pred=False, error=False, z
             cmap='RdBu_r',
             sharp_color_range=None,
             plot_triangulation=True,
-            postpone_show=postpone_show
-        )
-        _zoom_around(
-            axes[i],
-            x0=center_points[i][0] if center_points is not None else 0,
-            y0=center_points[i][1] if center_points is not None else 0,
-            zoom=zoom[i] if zoom is not None else 1
+            postpone_show=postpone_show,
+            triang=triang,
+            boundary_edges=boundary_edges
         )
-        axes[i].set_aspect('equal', adjustable='datalim')
-        if pred and error:
-            raise ValueError("Cannot set both pred and error to True.")
-        if pred:
-            normal_derivative = file["normal_derivative_pred"][:]
-        elif error:
-            normal_derivative = file["normal_derivative_pred"][:] - file["normal_derivatives_plate"][:]
-        else:
-            normal_derivative = file["normal_derivatives_plate"][:]
-        points = file["midpoints_plate"][:]
-        normals = file["normal_vectors_plate"][:]
-        U = normals[:, 0]
-        V = normals[:, 1]
-        lengths = normal_derivative
-        norm = (lengths - lengths.min()) / (np.ptp(lengths) + 1e-9)  
-        cmap = plt.cm.seismic
-        for j in range(len(points)):
-            color = cmap(norm[j])
-            plt.arrow(
-                points[j, 0], points[j, 1],
-                U[j], V[j],
-                head_width=0.05, head_length=0.05,
-                fc=color, ec=color
-            )
-        sm = plt.cm.ScalarMappable(
-        cmap=cmap,
-        norm=plt.Normalize(vmin=lengths.min(), vmax=lengths.max())
+        _zoom_subplot(axes[i], zooms[i], centers[i])
+        # Draw all the arrows at once, colored by the normal derivative
+        arrows = plt.quiver(
+            points[:, 0], points[:, 1],
+            U, V,
+            lengths,
+            cmap=plt.cm.seismic,
+            norm=norm,
+            angles='xy', scale_units='xy', scale=1
         )
-        sm.set_array([])
         ax = plt.gca()
-        plt.colorbar(sm, ax=ax, label="Derivative modulus")
+        plt.colorbar(arrows, ax=ax, label="Derivative modulus")
         if pred:
             ax.set_title("Predicted normal derivative (zoom {})".format(zoom[i]) if zoom is not None else "Predicted normal derivative")
         elif error:
@@ -631,17 +787,38 @@ def plot_normal_derivative(file, postpone_show=False, pred=False, error=False, z
         plt.show()
 
 
-def summary_plot(file: h5py.File) -> None:
+def summary_plot(file: h5py.File, output_folder: str = None, dpi: int = 150) -> None:
     """
     .. admonition:: Description
         
         It creates a summary plot with all relevant plots.
         
-    :param file: h5py file object containing the solution data.
+    :param file: h5py file object (or dictionary of arrays, see :func:`_load_datasets`) containing the solution data.
+    :param output_folder: Optional folder where to save the plots as images instead of showing them.
+    :param dpi: Resolution of the saved images (and of the rasterized artists).
+
+    .. note::
+
+        When saving, all the plots are drawn on the same figure, which is reused also by the following calls
+        (e.g., when exporting the plots of every solution in a results folder).
     """
-    plot_domain(file, postpone_show=True, zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)])
-    plot_potential(file, postpone_show=True, zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)])
-    plot_grad(file, postpone_show=True, zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)], component="x")
-    plot_grad(file, postpone_show=True, zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)], component="y")
-    plot_normal_derivative(file, postpone_show=True, zoom=[4], center_points=[(0,0)])
-    plt.show()
\ No newline at end of file
+    # Read the datasets and build the triangulation (and its connectivity) once for all the plots
+    data = _load_datasets(file)
+    triang = tri.Triangulation(*_load_mesh(data))
+    plots = [
+        ("domain", plot_domain, dict(zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)])),
+        ("potential", plot_potential, dict(zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)])),
+        ("grad_x", plot_grad, dict(zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)], component="x")),
+        ("grad_y", plot_grad, dict(zoom=[1, 4, 15], center_points=[(0,0), (0,0), (-50,0)], component="y")),
+        ("normal_derivative", plot_normal_derivative, dict(zoom=[4], center_points=[(0,0)])),
+    ]
+    if output_folder is None:
+        for _, plot_function, kwargs in plots:
+            plot_function(data, postpone_show=True, triang=triang, **kwargs)
+        plt.show()
+    else:
+        os.makedirs(output_folder, exist_ok=True)
+        fig = _get_fig()
+        for name, plot_function, kwargs in plots:
+            plot_function(data, postpone_show=True, triang=triang, fig=fig, **kwargs)
+            fig.savefig(os.path.join(output_folder, name + ".png"), dpi=dpi)
@@ -2,7 +2,7 @@
 Script to remove all .msh files from a specified data folder.
 Example of usage::
 
-    python -m data.remove_msh --folder <data_folder_path>
+    python -m data.remove_msh --folder <data_folder_path> [--verbose] [--workers <num_threads>]
 """
 
 from .mesh import remove_msh_files
@@ -11,9 +11,11 @@ import argparse
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--folder", type=str, default="test", help="Path to the data folder to clean msh files.")
-    data_folder = parser.parse_args().folder
+    parser.add_argument("--verbose", action="store_true", help="Print every removed file.")
+    parser.add_argument("--workers", type=int, default=16, help="Number of threads removing the files concurrently.")
+    args = parser.parse_args()
 
-    remove_msh_files(data_folder=data_folder)
+    remove_msh_files(data_folder=args.folder, verbose=args.verbose, max_workers=args.workers)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
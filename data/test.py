@@ -3,7 +3,7 @@ import h5py
 from .geometry import generate_geometries
 from .mesh import generate_meshes
 from .dataset import generate_datasets
-from .plot import summary_plot
+from .plot import summary_plot, _load_datasets
 
 
 def test(names: list[str],
@@ -31,6 +31,7 @@ def test(names: list[str],
     :param plot_number: number of the solution to plot.
     :param empty_old_mesh: whether to empty the old meshes folder before generating new meshes.
     :param empty_old_results: whether to empty the old results folder before generating new results.
+    :param workers: number of worker processes to use for parallel mesh and dataset generation.
 
     .. note:: 
         
@@ -54,9 +55,11 @@ def test(names: list[str],
 
     generate_meshes(data_folder=data_folder, empty_mesh_folder=empty_old_mesh, max_workers=workers)
 
-    generate_datasets(data_folder=data_folder, empty_results_folder=empty_old_results)
+    generate_datasets(data_folder=data_folder, empty_results_folder=empty_old_results, max_workers=workers)
 
     if plot_number is not None:
         path = data_folder + f"/results/{plot_number}.h5"
+        # Read everything the plots need, then release the file before plotting
         with h5py.File(path, "r") as file:
-            summary_plot(file)
\ No newline at end of file
+            data = _load_datasets(file)
+        summary_plot(data)
\ No newline at end of file
@@ -2,6 +2,25 @@ import h5py
 import numpy as np
 import pandas as pd
 import os
+
+
+def _pad_stack(arrays: list[np.ndarray], length: int, fill_value: float) -> np.ndarray:
+    """
+    .. admonition:: Description
+
+        Stack 1D arrays of different lengths into a 2D matrix, padding each row at the end with the given value.
+        The matrix is allocated once and each array is copied into its row, without intermediate padded copies.
+
+    :param arrays: Arrays to stack.
+    :param length: Length of the rows (at least the length of the longest array).
+    :param fill_value: Value used for padding.
+    :return: Matrix with one row per array.
+    """
+    stacked = np.full((len(arrays), length), fill_value, dtype=np.result_type(arrays[0].dtype, np.min_scalar_type(fill_value)))
+    for row, array in zip(stacked, arrays):
+        row[:len(array)] = array
+    return stacked
+
   
 def load(data_folder: str = "test") -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
@@ -49,33 +68,23 @@ def load(data_folder: str = "test") -> tuple[np.ndarray, np.ndarray, np.ndarray,
             x.append(np.array(file["x"]))
             y.append(np.array(file["y"]))
             potential.append(np.array(file["potential"]))
-            # Data on the upper plate
-            x_plate.append(np.array(file["midpoints_plate"][:, 0]))
-            y_plate.append(np.array(file["midpoints_plate"][:, 1]))
+            # Data on the upper plate (read the midpoints once)
+            midpoints_plate = file["midpoints_plate"][:]
+            x_plate.append(midpoints_plate[:, 0])
+            y_plate.append(midpoints_plate[:, 1])
             normal_derivatives_plate.append(np.array(file["normal_derivatives_plate"]))
     
     # Find maximum lengths for padding
     max_vertices = np.max([len(arr) for arr in x])
     max_plate_points = np.max([len(arr) for arr in x_plate])
 
-    # Pad arrays with zeros and nans to ensure uniform length based on maximum lengths
-    for i in range(len(x)):
-        
-        x[i] = np.pad(x[i], (0, max_vertices - len(x[i])), 'constant', constant_values=0)
-        y[i] = np.pad(y[i], (0, max_vertices - len(y[i])), 'constant', constant_values=0)
-        potential[i] = np.pad(potential[i], (0, max_vertices - len(potential[i])), 'constant', constant_values=np.nan)
-
-        x_plate[i] = np.pad(x_plate[i], (0, max_plate_points - len(x_plate[i])), 'constant', constant_values=0)
-        y_plate[i] = np.pad(y_plate[i], (0, max_plate_points - len(y_plate[i])), 'constant', constant_values=0)
-        normal_derivatives_plate[i] = np.pad(normal_derivatives_plate[i], (0, max_plate_points - len(normal_derivatives_plate[i])), 'constant', constant_values=np.nan)
-
-    # Stack arrays in each list to create 2D matrixes
-    x = np.stack(x)
-    y = np.stack(y)
-    potential = np.stack(potential)
-    x_plate =  np.stack(x_plate)
-    y_plate =  np.stack(y_plate)
-    normal_derivatives_plate = np.stack(normal_derivatives_plate)
+    # Fill 2D matrixes, padded with zeros and nans to ensure uniform length based on maximum lengths
+    x = _pad_stack(x, max_vertices, 0)
+    y = _pad_stack(y, max_vertices, 0)
+    potential = _pad_stack(potential, max_vertices, np.nan)
+    x_plate = _pad_stack(x_plate, max_plate_points, 0)
+    y_plate = _pad_stack(y_plate, max_plate_points, 0)
+    normal_derivatives_plate = _pad_stack(normal_derivatives_plate, max_plate_points, np.nan)
 
     # Read the geometrical parameters from the CSV file
     data_csv = pd.read_csv(f"{data_folder}/parameters.csv")
@@ -158,6 +158,7 @@ def main():
         import h5py
         from data.plot import plot_potential
         import matplotlib.pyplot as plt
+        import matplotlib.tri as tri
         fom_file = os.path.join(data_folder, "results", f"{idx}.h5")
         with h5py.File(fom_file, 'a') as file:
             # use x[0] to dectect and remove nan values in y_pred
@@ -171,16 +172,19 @@ def main():
             if "ae" in file:
                 del file["ae"]
             file["ae"] = np.abs(y_pred[0][nan_mask] - file["potential"][:])
-            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)])
-            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], error = True, error_type='ae')
-            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], error = True, error_type='se')
-            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], pred = True)
+            # Read the mesh once for all the plots
+            triang = tri.Triangulation(file["x"][:], file["y"][:], triangles=file["cells"][:])
+            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], triang=triang)
+            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], error = True, error_type='ae', triang=triang)
+            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], error = True, error_type='se', triang=triang)
+            plot_potential(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], pred = True, triang=triang)
             plt.show()
 
     elif target == "normal_derivative":
         import h5py
         from data.plot import plot_normal_derivative
         import matplotlib.pyplot as plt
+        import matplotlib.tri as tri
         fom_file = os.path.join(data_folder, "results", f"{idx}.h5")
         with h5py.File(fom_file, 'a') as file:
             # use x[0] to dectect and remove nan values in y_pred
@@ -194,9 +198,11 @@ def main():
             if "normal_ae" in file:
                 del file["normal_ae"]
             file["normal_ae"] = np.abs(y_pred[0][nan_mask] - file["normal_derivatives_plate"][:])
-            plot_normal_derivative(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)])
-            plot_normal_derivative(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], error = True)
-            plot_normal_derivative(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], pred = True)
+            # Read the mesh once for all the plots
+            triang = tri.Triangulation(file["x"][:], file["y"][:], triangles=file["cells"][:])
+            plot_normal_derivative(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], triang=triang)
+            plot_normal_derivative(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], error = True, triang=triang)
+            plot_normal_derivative(file, postpone_show=True, zoom=[4, 15, 15], center_points=[(0,0), (-50,0), (50,0)], pred = True, triang=triang)
             plt.show()
 
 